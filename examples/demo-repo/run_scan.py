@@ -3,28 +3,197 @@
 Venice AI API Test Script for HQE Workbench
 
 This script runs the HQE Workbench on the example repository using the Venice AI API.
+
+Optional dependencies:
+    orjson - faster parsing of report.json (pip install orjson)
+    ijson  - streams report.json for the summary instead of loading it whole
+             (pip install ijson)
 """
 
 import os
 import sys
 import subprocess
+import threading
 import argparse
+import functools
 import json
+from collections import ChainMap
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Values used when venice.config does not set them
+VENICE_DEFAULTS = {
+    'VENICE_MODEL_NAME': 'venice-medium',
+    'VENICE_API_BASE_URL': 'https://api.venice.ai/v1',
+    'VENICE_REQUEST_TIMEOUT': '60',
+}
+_get_scan_settings = itemgetter('VENICE_MODEL_NAME', 'VENICE_API_BASE_URL', 'VENICE_REQUEST_TIMEOUT')
+
+# Sections of report.json shown in the summary, and the arrays counted within them
+REPORT_SECTIONS = (
+    'executive_summary',
+    'project_map.architecture',
+    'deep_scan_results',
+    'master_todo_backlog',
+)
+REPORT_COUNTS = (
+    'executive_summary.top_priorities',
+    'executive_summary.critical_findings',
+    'project_map.architecture.languages',
+    'deep_scan_results.security',
+    'deep_scan_results.code_quality',
+    'master_todo_backlog',
+)
+
 def load_venice_config(config_path):
     """Load Venice API configuration from file."""
-    config = {}
-    if os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key.strip()] = value.strip()
-    return config
+    if not os.path.exists(config_path):
+        return {}
+    return dict(_load_venice_config_cached(str(config_path), os.stat(config_path).st_mtime_ns))
+
+@functools.lru_cache(maxsize=4)
+def _load_venice_config_cached(config_path, mtime_ns):
+    """Parse a Venice config file, cached on (path, mtime)."""
+    lines = (line.strip() for line in Path(config_path).read_text().splitlines())
+    pairs = (
+        line.split('=', 1) for line in lines
+        if line and not line.startswith('#') and '=' in line
+    )
+    return {key.strip(): value.strip() for key, value in pairs}
+
+def _summarize_report_dom(report_path):
+    """
+    Build the report summary from a fully parsed report.json.
+
+    This is the reference behaviour: sections count as present when their key
+    exists, and counts are len() of the value.
+    """
+    report = _loads(report_path.read_bytes())
+    sections = set()
+    counts = dict.fromkeys(REPORT_COUNTS, 0)
+    health_score = 'N/A'
+
+    if 'executive_summary' in report:
+        summary = report['executive_summary']
+        sections.add('executive_summary')
+        health_score = summary.get('health_score', 'N/A')
+        counts['executive_summary.top_priorities'] = len(summary.get('top_priorities', []))
+        counts['executive_summary.critical_findings'] = len(summary.get('critical_findings', []))
+
+    if 'project_map' in report:
+        project_map = report['project_map']
+        if 'architecture' in project_map:
+            arch = project_map['architecture']
+            sections.add('project_map.architecture')
+            counts['project_map.architecture.languages'] = len(arch.get('languages', []))
+
+    if 'deep_scan_results' in report:
+        scan_results = report['deep_scan_results']
+        sections.add('deep_scan_results')
+        counts['deep_scan_results.security'] = len(scan_results.get('security', []))
+        counts['deep_scan_results.code_quality'] = len(scan_results.get('code_quality', []))
+
+    if 'master_todo_backlog' in report:
+        sections.add('master_todo_backlog')
+        counts['master_todo_backlog'] = len(report['master_todo_backlog'])
+
+    return sections, health_score, counts
+
+class _UnstreamableReport(Exception):
+    """Raised when report.json has a shape the streaming summary does not handle."""
+
+# Containers the summary reads keys from, which must be objects to stream
+_REPORT_MAPS = frozenset({
+    '',
+    'executive_summary',
+    'project_map',
+    'project_map.architecture',
+    'deep_scan_results',
+})
+
+def _summarize_report_stream(report_path):
+    """
+    Build the report summary from the ijson event stream.
+
+    Handles reports whose summarized sections are objects, whose counted
+    values are arrays or objects and whose health score is a scalar. Any other
+    shape, and dotted or duplicate keys in the objects it reads (which ijson
+    prefixes cannot tell apart, or which a full parse collapses to the last
+    value), raises _UnstreamableReport so the caller can use the reference path.
+    """
+    sections = set()
+    counts = dict.fromkeys(REPORT_COUNTS, 0)
+    kinds = {}
+    keys_seen = {}
+    health_score = 'N/A'
+
+    with open(report_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if event == 'map_key':
+                if prefix in _REPORT_MAPS or kinds.get(prefix) == 'map':
+                    seen = keys_seen.setdefault(prefix, set())
+                    if value in seen or (prefix in _REPORT_MAPS and '.' in value):
+                        raise _UnstreamableReport(prefix)
+                    seen.add(value)
+                if kinds.get(prefix) == 'map':
+                    counts[prefix] += 1
+                key = f'{prefix}.{value}' if prefix else value
+                if key in REPORT_SECTIONS:
+                    sections.add(key)
+                continue
+            if event in ('end_map', 'end_array'):
+                continue
+
+            parent, _, last = prefix.rpartition('.')
+            if last == 'item' and kinds.get(parent) == 'array':
+                counts[parent] += 1
+
+            if prefix in REPORT_COUNTS:
+                if event == 'start_array':
+                    kinds[prefix] = 'array'
+                elif event == 'start_map':
+                    kinds[prefix] = 'map'
+                else:
+                    raise _UnstreamableReport(prefix)
+            elif prefix in _REPORT_MAPS:
+                if event != 'start_map':
+                    raise _UnstreamableReport(prefix)
+            elif prefix == 'executive_summary.health_score':
+                if event in ('start_map', 'start_array'):
+                    raise _UnstreamableReport(prefix)
+                health_score = value
+
+    return sections, health_score, counts
+
+def summarize_report(report_path):
+    """
+    Collect the report summary from report.json.
+
+    Streams the file with ijson when available so no document tree is built,
+    falling back to the full parse in _summarize_report_dom, which is the
+    reference behaviour, for inputs the stream does not handle. Streaming keeps
+    peak memory flat on large reports but is slower than an orjson full parse.
+    Returns (sections, health_score, counts).
+    """
+    if ijson is not None:
+        try:
+            return _summarize_report_stream(report_path)
+        except _UnstreamableReport:
+            pass
+    return _summarize_report_dom(report_path)
 
 def validate_environment():
     """Validate that required environment and tools are available."""
@@ -43,34 +212,55 @@ def validate_environment():
     return True
 
 def run_hqe_scan(repo_path, output_dir, config):
-    """Run HQE Workbench scan with Venice API."""
+    """
+    Run HQE Workbench scan with Venice API.
+
+    config must already include VENICE_DEFAULTS, as built in main().
+    """
+    model, base_url, timeout = _get_scan_settings(config)
     cmd = [
         './hqe_mock_refactored.sh', 'scan',
         '--repo', repo_path,
         '--provider', 'venice',
-        '--model', config.get('VENICE_MODEL_NAME', 'venice-medium'),
-        '--base-url', config.get('VENICE_API_BASE_URL', 'https://api.venice.ai/v1'),
+        '--model', model,
+        '--base-url', base_url,
         '--api-key', os.environ['VENICE_API_KEY'],
-        '--timeout', config.get('VENICE_REQUEST_TIMEOUT', '60'),
+        '--timeout', timeout,
         '--out', str(output_dir),
         '--verbose'
     ]
 
     print(f"Running command: {' '.join(cmd)}")
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        print("Scan completed successfully!")
-        print("STDOUT:", result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Scan failed with return code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
+    ) as proc:
+        # Drain stderr on a separate thread so neither pipe can fill up and block
+        def drain_stderr():
+            for line in proc.stderr:
+                print(f"STDERR: {line}", end='', file=sys.stderr)
+
+        stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_thread.start()
+
+        try:
+            for line in proc.stdout:
+                print(line, end='')
+            returncode = proc.wait()
+        except BaseException:
+            # Don't leave the scan running if we are interrupted mid-stream
+            proc.kill()
+            raise
+        finally:
+            stderr_thread.join()
+
+    if returncode != 0:
+        print(f"Scan failed with return code {returncode}")
         return False
 
+    print("Scan completed successfully!")
+    return True
+
 def main():
     parser = argparse.ArgumentParser(description='Run HQE Workbench with Venice AI API')
     parser.add_argument('--repo', default='./example-repo', help='Path to repository to scan (default: ./example-repo)')
@@ -83,8 +273,8 @@ def main():
     if not validate_environment():
         sys.exit(1)
 
-    # Load configuration
-    config = load_venice_config(args.config)
+    # Load configuration, with defaults for any settings it leaves out
+    config = ChainMap(load_venice_config(args.config), VENICE_DEFAULTS)
 
     # Set up output directory
     if args.output:
@@ -95,63 +285,60 @@ def main():
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    print("="*60)
-    print("HQE Workbench - Venice AI API Test")
-    print("="*60)
-    print(f"Repository: {args.repo}")
-    print(f"Output directory: {output_dir.absolute()}")
-    print(f"Venice API endpoint: {config.get('VENICE_API_BASE_URL', 'https://api.venice.ai/v1')}")
-    print(f"Venice model: {config.get('VENICE_MODEL_NAME', 'venice-medium')}")
-    print("-"*60)
+    sys.stdout.write('\n'.join([
+        "="*60,
+        "HQE Workbench - Venice AI API Test",
+        "="*60,
+        f"Repository: {args.repo}",
+        f"Output directory: {output_dir.absolute()}",
+        f"Venice API endpoint: {config['VENICE_API_BASE_URL']}",
+        f"Venice model: {config['VENICE_MODEL_NAME']}",
+        "-"*60,
+    ]) + '\n')
 
     # Run the scan
     success = run_hqe_scan(args.repo, str(output_dir), config)
 
     if success:
-        print("\nScan completed successfully!")
-        print(f"Results are available in: {output_dir.absolute()}")
+        lines = [
+            "",
+            "Scan completed successfully!",
+            f"Results are available in: {output_dir.absolute()}",
+        ]
 
         # Show summary if report is available
         report_path = output_dir / 'report.json'
         if report_path.exists():
-            print("\nReport Summary:")
+            lines += ["", "Report Summary:"]
             try:
-                with open(report_path, 'r') as f:
-                    report = json.load(f)
-
-                # Print basic statistics
-                if 'executive_summary' in report:
-                    summary = report['executive_summary']
-                    print(f"  Health Score: {summary.get('health_score', 'N/A')}")
-                    print(f"  Top Priorities: {len(summary.get('top_priorities', []))} items")
-                    print(f"  Critical Findings: {len(summary.get('critical_findings', []))} items")
-
-                if 'project_map' in report:
-                    project_map = report['project_map']
-                    if 'architecture' in project_map:
-                        arch = project_map['architecture']
-                        print(f"  Languages Detected: {len(arch.get('languages', []))}")
-
-                if 'deep_scan_results' in report:
-                    scan_results = report['deep_scan_results']
-                    print(f"  Security Issues: {len(scan_results.get('security', []))}")
-                    print(f"  Code Quality Issues: {len(scan_results.get('code_quality', []))}")
-
-                if 'master_todo_backlog' in report:
-                    todos = report['master_todo_backlog']
-                    print(f"  TODO Items: {len(todos)}")
+                sections, health_score, counts = summarize_report(report_path)
+
+                # Collect basic statistics
+                if 'executive_summary' in sections:
+                    lines.append(f"  Health Score: {health_score}")
+                    lines.append(f"  Top Priorities: {counts['executive_summary.top_priorities']} items")
+                    lines.append(f"  Critical Findings: {counts['executive_summary.critical_findings']} items")
+
+                if 'project_map.architecture' in sections:
+                    lines.append(f"  Languages Detected: {counts['project_map.architecture.languages']}")
+
+                if 'deep_scan_results' in sections:
+                    lines.append(f"  Security Issues: {counts['deep_scan_results.security']}")
+                    lines.append(f"  Code Quality Issues: {counts['deep_scan_results.code_quality']}")
+
+                if 'master_todo_backlog' in sections:
+                    lines.append(f"  TODO Items: {counts['master_todo_backlog']}")
 
             except Exception as e:
-                print(f"  Could not parse report.json: {e}")
+                lines.append(f"  Could not parse report.json: {e}")
         else:
-            print(f"\nNo report.json found in output directory")
+            lines += ["", "No report.json found in output directory"]
     else:
         print("\nScan failed!")
         sys.exit(1)
 
-    print("\n" + "="*60)
-    print("HQE Workbench scan completed")
-    print("="*60)
+    lines += ["", "="*60, "HQE Workbench scan completed", "="*60]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -6,35 +6,104 @@ Validates HQE Engineer YAML protocol files against the JSON Schema.
 Also performs additional semantic linting.
 
 Usage:
-    python validate.py <path_to_yaml_file>
+    python validate.py <path_to_yaml_file> [<path_to_yaml_file> ...]
+    python validate.py --schema-file <schema.json> <path_to_yaml_file>
     python validate.py --schema  # Validate the schema itself
 """
 
+import os
 import sys
 import json
+import argparse
+import functools
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Try to import jsonschema, fall back to basic validation if not available
 try:
-    from jsonschema import validate, ValidationError, Draft7Validator
+    from jsonschema.validators import validator_for
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
-    print("Warning: jsonschema not installed. Install with: pip install jsonschema")
+    print("Warning: jsonschema not installed. Install with: pip install jsonschema", file=sys.stderr)
+
+# Prefer orjson for JSON parsing, fall back to the stdlib parser if not available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
+# Prefer the LibYAML-backed loader, fall back to the pure-Python one if not available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    print("Warning: PyYAML built without LibYAML, YAML parsing will be slow", file=sys.stderr)
+
+
+# Keys that must be present in the schema and protocol YAML, in reporting order
+_REQUIRED_SCHEMA_FIELDS = ('$schema', 'type', 'properties')
+_REQUIRED_PREFIXES = ('BOOT', 'SEC', 'BUG', 'PERF', 'DOC')
+_REQUIRED_PHASES = ('phase_zero', 'phase_one', 'phase_two', 'phase_three')
+
+# Per-schema results keyed by schema identity, so work is done once per schema object
+_SCHEMA_CACHE_SIZE = 8
+_VALIDATOR_CACHE: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+_SCHEMA_ISSUES_CACHE: Dict[int, Tuple[Dict[str, Any], List[str]]] = {}
+
+
+def _cached_per_schema(cache: Dict[int, Tuple[Dict[str, Any], Any]], schema: Dict[str, Any],
+                       build: Callable[[Dict[str, Any]], Any]) -> Any:
+    """
+    Return build(schema), computing it only once per schema object.
+
+    Entries keep a reference to their schema so a reused id() is never mistaken
+    for a hit; the oldest entry is evicted once the cache is full.
+    """
+    cached = cache.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        if len(cache) >= _SCHEMA_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cached = cache[id(schema)] = (schema, build(schema))
+    return cached[1]
+
+
+def _build_validator(schema: Dict[str, Any]) -> Any:
+    """Check the schema and compile a validator for its $schema draft."""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def get_validator(schema: Dict[str, Any]) -> Any:
+    """Return a compiled validator for the schema's $schema draft, building it on first use."""
+    return _cached_per_schema(_VALIDATOR_CACHE, schema, _build_validator)
 
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     """Load YAML file."""
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    """Load JSON file."""
-    with open(path, 'r') as f:
-        return json.load(f)
+    """
+    Load JSON file.
+
+    The parsed result is shared between calls while the file is unchanged,
+    so callers must not mutate it.
+    """
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file, cached on (path, mtime)."""
+    return _loads(Path(path).read_bytes())
 
 
 def validate_schema_structure(schema: Dict[str, Any]) -> List[str]:
@@ -42,8 +111,7 @@ def validate_schema_structure(schema: Dict[str, Any]) -> List[str]:
     errors = []
     
     # Check required top-level fields
-    required_fields = ['$schema', 'type', 'properties']
-    for field in required_fields:
+    for field in _REQUIRED_SCHEMA_FIELDS:
         if field not in schema:
             errors.append(f"Schema missing required field: {field}")
     
@@ -60,6 +128,11 @@ def validate_schema_structure(schema: Dict[str, Any]) -> List[str]:
     return errors
 
 
+def validate_schema_structure_once(schema: Dict[str, Any]) -> List[str]:
+    """Like validate_schema_structure, but only walks each schema object once."""
+    return list(_cached_per_schema(_SCHEMA_ISSUES_CACHE, schema, validate_schema_structure))
+
+
 def validate_yaml_semantics(data: Dict[str, Any]) -> List[str]:
     """Perform semantic validation beyond schema."""
     errors = []
@@ -76,25 +149,22 @@ def validate_yaml_semantics(data: Dict[str, Any]) -> List[str]:
     definitions = data.get('definitions', {})
     id_prefixes = definitions.get('id_prefixes', {})
     
-    required_prefixes = ['BOOT', 'SEC', 'BUG', 'PERF', 'DOC']
-    for prefix in required_prefixes:
+    for prefix in _REQUIRED_PREFIXES:
         if prefix not in id_prefixes:
             errors.append(f"Missing required ID prefix: {prefix}")
     
     # Check constraints have proper IDs
     constraints = data.get('constraints', [])
-    expected_id = 1
-    for constraint in constraints:
-        cid = constraint.get('id', '')
-        expected_cid = f"C{expected_id}"
-        if cid != expected_cid:
-            errors.append(f"Constraint ID out of order: expected {expected_cid}, got {cid}")
-        expected_id += 1
+    ids = [constraint.get('id', '') for constraint in constraints]
+    expected_ids = [f"C{i}" for i in range(1, len(ids) + 1)]
+    if ids != expected_ids:
+        for cid, expected_cid in zip(ids, expected_ids):
+            if cid != expected_cid:
+                errors.append(f"Constraint ID out of order: expected {expected_cid}, got {cid}")
     
     # Check phases exist
     phases = data.get('phases', {})
-    required_phases = ['phase_zero', 'phase_one', 'phase_two', 'phase_three']
-    for phase in required_phases:
+    for phase in _REQUIRED_PHASES:
         if phase not in phases:
             errors.append(f"Missing required phase: {phase}")
     
@@ -128,9 +198,7 @@ def validate_with_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> List[s
     if not HAS_JSONSCHEMA:
         return ["jsonschema not installed, skipping schema validation"]
     
-    try:
-        validate(instance=data, schema=schema)
-    except ValidationError as e:
+    for e in get_validator(schema).iter_errors(data):
         errors.append(f"Schema validation error: {e.message}")
         errors.append(f"  Path: {'/'.join(str(p) for p in e.path)}")
     
@@ -152,18 +220,23 @@ def lint_yaml_file(yaml_path: Path, schema_path: Path = None) -> Tuple[bool, Lis
     except yaml.YAMLError as e:
         return False, [f"YAML parse error: {e}"], []
     
+    if not isinstance(data, dict):
+        return False, [f"YAML document must be a mapping, got {type(data).__name__}"], []
+    
     # Load schema if provided
-    if schema_path and schema_path.exists():
+    if schema_path:
         try:
             schema = load_json(schema_path)
             # Validate schema itself
-            schema_errors = validate_schema_structure(schema)
+            schema_errors = validate_schema_structure_once(schema)
             if schema_errors:
                 warnings.extend([f"Schema issue: {e}" for e in schema_errors])
             
             # Validate against schema
             schema_errors = validate_with_schema(data, schema)
             errors.extend(schema_errors)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             warnings.append(f"Could not validate against schema: {e}")
     
@@ -175,52 +248,56 @@ def lint_yaml_file(yaml_path: Path, schema_path: Path = None) -> Tuple[bool, Lis
     return len(errors) == 0, errors, warnings
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate.py <path_to_yaml_file>")
-        print("       python validate.py --schema  # Validate schema")
-        sys.exit(1)
-    
-    arg = sys.argv[1]
-    
-    # Get paths
-    script_dir = Path(__file__).parent
-    schema_path = script_dir / "hqe-engineer-schema.json"
+def _lint_one(yaml_path: Path, schema_path: Path = None) -> Tuple[Path, bool, List[str], List[str]]:
+    """
+    Lint one YAML file, returning its path with the result (used by lint_many workers).
+
+    A file that cannot be read or linted is reported as a failed result so
+    the rest of the batch is still linted.
+    """
+    try:
+        is_valid, errors, warnings = lint_yaml_file(yaml_path, schema_path)
+    except FileNotFoundError:
+        return yaml_path, False, [f"File not found: {yaml_path}"], []
+    except OSError as e:
+        return yaml_path, False, [f"Could not read file: {e}"], []
+    except Exception as e:
+        return yaml_path, False, [f"Could not lint file: {e}"], []
+    return yaml_path, is_valid, errors, warnings
+
+
+def lint_many(yaml_paths: List[Path], schema_path: Path = None, jobs: Optional[int] = 1) -> List[Tuple[Path, bool, List[str], List[str]]]:
+    """
+    Lint several YAML files against one schema.
+
+    With jobs=1 the files are linted in this process, loading the schema and
+    compiling its validator once for the whole batch. Otherwise they are
+    spread over a pool of `jobs` worker processes (all CPUs if None or 0,
+    never more than there are files), each of which loads the schema once.
+    Returns: [(yaml_path, is_valid, errors, warnings), ...] in input order
+    """
+    if jobs is not None and jobs < 0:
+        raise ValueError(f"jobs must be 0 or more, got {jobs}")
     
-    if arg == "--schema":
-        # Validate the schema itself
-        if schema_path.exists():
-            try:
-                schema = load_json(schema_path)
-                errors = validate_schema_structure(schema)
-                if errors:
-                    print("Schema validation errors:")
-                    for e in errors:
-                        print(f"  - {e}")
-                    sys.exit(1)
-                else:
-                    print("✓ Schema is valid")
-                    sys.exit(0)
-            except Exception as e:
-                print(f"Error loading schema: {e}")
-                sys.exit(1)
-        else:
-            print(f"Schema not found: {schema_path}")
-            sys.exit(1)
+    lint_one = functools.partial(_lint_one, schema_path=schema_path)
     
-    # Validate YAML file
-    yaml_path = Path(arg)
-    if not yaml_path.exists():
-        print(f"File not found: {yaml_path}")
-        sys.exit(1)
+    workers = min(jobs or os.cpu_count() or 1, len(yaml_paths))
+    if workers <= 1:
+        return [lint_one(yaml_path) for yaml_path in yaml_paths]
     
+    chunksize = max(1, len(yaml_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lint_one, yaml_paths, chunksize=chunksize))
+
+
+def print_result(yaml_path: Path, is_valid: bool, errors: List[str], warnings: List[str],
+                 schema_path: Optional[Path] = None):
+    """Print the lint result for one YAML file, naming the schema if one was used."""
     print(f"Validating: {yaml_path}")
-    if schema_path.exists():
+    if schema_path:
         print(f"Using schema: {schema_path}")
     print()
     
-    is_valid, errors, warnings = lint_yaml_file(yaml_path, schema_path)
-    
     if warnings:
         print("Warnings:")
         for w in warnings:
@@ -233,12 +310,113 @@ def main():
             print(f"  ✗ {e}")
         print()
         print(f"Validation FAILED: {len(errors)} error(s)")
-        sys.exit(1)
     else:
         print(f"✓ Validation passed")
         if warnings:
             print(f"  ({len(warnings)} warning(s) - review recommended)")
-        sys.exit(0)
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for integer options that must be 0 or more."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def main():
+    script_dir = Path(__file__).parent
+    
+    parser = argparse.ArgumentParser(
+        description='Validate HQE Engineer YAML protocol files against the JSON Schema',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 validate.py hqe-engineer.yaml
+  python3 validate.py protocols/*.yaml
+  python3 validate.py --schema-file custom-schema.json hqe-engineer.yaml
+  python3 validate.py --schema
+        """
+    )
+    
+    parser.add_argument(
+        'files',
+        nargs='*',
+        type=Path,
+        help='YAML file(s) to validate'
+    )
+    
+    parser.add_argument(
+        '--schema',
+        action='store_true',
+        help='Validate the schema itself'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=non_negative_int,
+        default=None,
+        help='Worker processes for validating several files (default or 0: all CPUs, 1 to disable)'
+    )
+    
+    parser.add_argument(
+        '--schema-file',
+        type=Path,
+        default=script_dir / "hqe-engineer-schema.json",
+        help='Path to JSON schema file (default: hqe-engineer-schema.json next to this script)'
+    )
+    
+    args = parser.parse_args()
+    schema_path = args.schema_file
+    
+    if args.schema:
+        # Validate the schema itself
+        try:
+            schema = load_json(schema_path)
+        except FileNotFoundError:
+            print(f"Schema not found: {schema_path}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error loading schema: {e}")
+            sys.exit(1)
+        
+        errors = validate_schema_structure(schema)
+        if errors:
+            print("Schema validation errors:")
+            for e in errors:
+                print(f"  - {e}")
+            sys.exit(1)
+        else:
+            print("✓ Schema is valid")
+            sys.exit(0)
+    
+    if not args.files:
+        parser.print_usage()
+        sys.exit(1)
+    
+    # Validate YAML files
+    # Load the schema up front; lint_yaml_file reuses the cached parse
+    try:
+        load_json(schema_path)
+        used_schema = schema_path
+    except Exception:
+        used_schema = None
+    
+    results = lint_many(args.files, schema_path, jobs=args.jobs)
+    for i, (yaml_path, is_valid, errors, warnings) in enumerate(results):
+        if i:
+            print()
+        print_result(yaml_path, is_valid, errors, warnings, used_schema)
+    
+    failed = sum(1 for _, is_valid, _, _ in results if not is_valid)
+    if len(results) > 1:
+        print()
+        print(f"{len(results) - failed}/{len(results)} file(s) passed")
+    
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
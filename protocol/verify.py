@@ -14,53 +14,140 @@ Exit codes:
 import argparse
 import json
 import sys
+from collections import ChainMap
+from operator import itemgetter
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, Optional
 
 try:
     import yaml
-    from jsonschema import validate, ValidationError, Draft202012Validator
+    from jsonschema.validators import validator_for
 except ImportError as e:
     print(f"Error: Missing required dependency - {e}")
     print("Install with: pip install pyyaml jsonschema")
     sys.exit(2)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    print("Warning: PyYAML built without LibYAML, YAML parsing will be slow", file=sys.stderr)
+
+
+# Compiled validators keyed by schema identity, so each schema is checked once
+_VALIDATOR_CACHE: dict = {}
+_VALIDATOR_CACHE_SIZE = 8
+
+
+def get_validator(schema: dict):
+    """Return a compiled validator for the schema's $schema draft, building it on first use."""
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+            _VALIDATOR_CACHE.pop(next(iter(_VALIDATOR_CACHE)))
+        cached = _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return cached[1]
+
 
 def load_yaml(filepath: Path) -> dict:
     """Load and parse YAML file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    with open(filepath, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def load_json(filepath: Path) -> dict:
     """Load and parse JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _loads(filepath.read_bytes())
 
 
-def validate_yaml(yaml_data: dict, schema: dict) -> tuple[bool, list]:
+def _error_to_dict(e) -> dict:
+    """Convert a jsonschema ValidationError into the error dict used for reporting."""
+    return {
+        'message': e.message,
+        'path': list(e.path) if e.path else ['root'],
+        'schema_path': list(e.schema_path) if e.schema_path else [],
+        'validator': e.validator,
+        'validator_value': e.validator_value
+    }
+
+
+def iter_validation_errors(yaml_data: dict, schema: dict) -> Iterator[dict]:
     """
-    Validate YAML data against schema.
-    Returns (is_valid, errors).
+    Lazily validate YAML data against schema.
+    Yields one error dict per schema violation, in validator order.
     """
-    errors = []
+    for e in get_validator(schema).iter_errors(yaml_data):
+        yield _error_to_dict(e)
+
+
+def collect_validation_errors(yaml_data: dict, schema: dict,
+                              max_errors: Optional[int] = None) -> tuple[list, bool]:
+    """
+    Collect the first max_errors errors (all if None) in validator order,
+    then order them by path.
+    Returns (errors, truncated) where truncated means more errors exist.
+    """
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be at least 1, got {max_errors}")
     
-    try:
-        validate(instance=yaml_data, schema=schema)
-        return True, []
-    except ValidationError as e:
-        errors.append({
-            'message': e.message,
-            'path': list(e.path) if e.path else ['root'],
-            'schema_path': list(e.schema_path) if e.schema_path else [],
-            'validator': e.validator,
-            'validator_value': e.validator_value
-        })
-        return False, errors
+    limit = None if max_errors is None else max_errors + 1
+    errors = list(islice(iter_validation_errors(yaml_data, schema), limit))
+    truncated = max_errors is not None and len(errors) > max_errors
+    errors = errors[:max_errors]
+    errors.sort(key=_error_sort_key)
+    return errors, truncated
+
+
+def validate_yaml(yaml_data: dict, schema: dict, max_errors: Optional[int] = None) -> tuple[bool, list]:
+    """
+    Validate YAML data against schema.
+    Returns (is_valid, errors) with the first max_errors errors found (all if None),
+    ordered by path. is_valid reflects whether any error exists, regardless of max_errors.
+    """
+    errors, _ = collect_validation_errors(yaml_data, schema, max_errors)
+    return len(errors) == 0, errors
+
+
+def _error_sort_key(error: dict) -> list:
+    """
+    Order errors by instance path, with errors at the document root first.
+    Array indices compare numerically and sort before property names.
+    """
+    if error['path'] == ['root']:
+        return []
+    return [(0, p, '') if isinstance(p, int) else (1, 0, str(p)) for p in error['path']]
+
+
+# Top-level fields shown by print_summary, with the value used when absent
+_SUMMARY_DEFAULTS = {
+    'schema_version': 'N/A',
+    'protocol_version': 'N/A',
+    'last_updated': 'N/A',
+    'license': 'N/A',
+    'maintainer': 'N/A',
+    'role': {},
+    'phases': {},
+    'hard_constraints': [],
+    'operating_principles': [],
+    'anti_patterns': [],
+}
+_get_summary_fields = itemgetter(*_SUMMARY_DEFAULTS)
 
 
 def print_validation_errors(errors: list):
     """Pretty print validation errors."""
-    print("\n❌ Validation Errors:")
+    print(f"\n❌ Validation Errors ({len(errors)}):")
     print("=" * 60)
     
     for i, error in enumerate(errors, 1):
@@ -75,39 +162,51 @@ def print_validation_errors(errors: list):
 
 def print_summary(yaml_data: dict, schema: dict, is_valid: bool):
     """Print validation summary."""
-    print("\n" + "=" * 60)
-    if is_valid:
-        print("✅ VALIDATION PASSED")
-    else:
-        print("❌ VALIDATION FAILED")
-    print("=" * 60)
-    
-    # Print metadata
-    print("\n📋 Protocol Metadata:")
-    print(f"  Schema Version:    {yaml_data.get('schema_version', 'N/A')}")
-    print(f"  Protocol Version:  {yaml_data.get('protocol_version', 'N/A')}")
-    print(f"  Last Updated:      {yaml_data.get('last_updated', 'N/A')}")
-    print(f"  License:           {yaml_data.get('license', 'N/A')}")
-    print(f"  Maintainer:        {yaml_data.get('maintainer', 'N/A')}")
-    
-    role = yaml_data.get('role', {})
-    print(f"  Role:              {role.get('title', 'N/A')}")
-    
-    # Print structure info
-    print("\n📊 Structure Summary:")
-    phases = yaml_data.get('phases', {})
-    print(f"  Phases defined:    {len(phases)}")
-    for phase_name in phases.keys():
-        print(f"    - {phase_name}")
-    
-    constraints = yaml_data.get('hard_constraints', [])
-    print(f"  Hard constraints:  {len(constraints)}")
+    (schema_version, protocol_version, last_updated, license_, maintainer,
+     role, phases, constraints, principles, anti_patterns) = _get_summary_fields(
+        ChainMap(yaml_data, _SUMMARY_DEFAULTS)
+    )
     
-    principles = yaml_data.get('operating_principles', [])
-    print(f"  Operating principles: {len(principles)}")
+    lines = [
+        "",
+        "=" * 60,
+        "✅ VALIDATION PASSED" if is_valid else "❌ VALIDATION FAILED",
+        "=" * 60,
+        
+        # Metadata
+        "",
+        "📋 Protocol Metadata:",
+        f"  Schema Version:    {schema_version}",
+        f"  Protocol Version:  {protocol_version}",
+        f"  Last Updated:      {last_updated}",
+        f"  License:           {license_}",
+        f"  Maintainer:        {maintainer}",
+        f"  Role:              {role.get('title', 'N/A')}",
+        
+        # Structure info
+        "",
+        "📊 Structure Summary:",
+        f"  Phases defined:    {len(phases)}",
+    ]
+    lines.extend(f"    - {phase_name}" for phase_name in phases.keys())
+    lines += [
+        f"  Hard constraints:  {len(constraints)}",
+        f"  Operating principles: {len(principles)}",
+        f"  Anti-patterns:     {len(anti_patterns)}",
+    ]
     
-    anti_patterns = yaml_data.get('anti_patterns', [])
-    print(f"  Anti-patterns:     {len(anti_patterns)}")
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -136,6 +235,13 @@ Examples:
         help='Path to JSON schema file (default: hqe-schema.json)'
     )
     
+    parser.add_argument(
+        '--max-errors',
+        type=positive_int,
+        default=50,
+        help='Stop after reporting this many schema errors (default: 50)'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -144,15 +250,6 @@ Examples:
     
     args = parser.parse_args()
     
-    # Check files exist
-    if not args.yaml.exists():
-        print(f"Error: YAML file not found: {args.yaml}")
-        sys.exit(2)
-    
-    if not args.schema.exists():
-        print(f"Error: Schema file not found: {args.schema}")
-        sys.exit(2)
-    
     try:
         # Load files
         if args.verbose:
@@ -167,15 +264,22 @@ Examples:
         if args.verbose:
             print("Validating...")
         
-        is_valid, errors = validate_yaml(yaml_data, schema)
+        # Collect one extra error to tell whether the list was truncated
+        errors, truncated = collect_validation_errors(yaml_data, schema, args.max_errors)
+        is_valid = len(errors) == 0
         
         if not is_valid:
             print_validation_errors(errors)
+            if truncated:
+                print(f"\n(stopped after {args.max_errors} errors, use --max-errors to see more)")
         
         print_summary(yaml_data, schema, is_valid)
         
         sys.exit(0 if is_valid else 1)
         
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e.filename}")
+        sys.exit(2)
     except yaml.YAMLError as e:
         print(f"Error: Invalid YAML syntax - {e}")
         sys.exit(2)